@@ -666,7 +666,12 @@ def split_type(t, model):
 
 def hastype_helper(value, model):
     """Helper to implement hastype."""
-    if isinstance(model, AbstractUnion):
+    if value is model:
+        # Abstract values are interned, so this is the common case where
+        # the value's type is exactly the model, e.g. hastype(x, i64) with
+        # a broadened i64 x, and it does not need a full typecheck.
+        return True
+    elif isinstance(model, AbstractUnion):
         results = [hastype_helper(value, opt) for opt in model.options]
         if any(r is True for r in results):
             return True
@@ -21,7 +21,7 @@ from ..utils import (
     dataclass_fields,
     is_dataclass_type,
 )
-from ..utils.misc import RandomStateWrapper
+from ..utils.misc import RandomStateWrapper, numeric_scalar_types
 from .amerge import amerge
 from .data import (
     ALIASID,
@@ -188,8 +188,14 @@ def to_abstract(self, v: list, **kwargs):
     if v == []:
         return empty
     else:
-        elem_types = [self(elem, **kwargs) for elem in v]
-        elem_type = reduce(amerge, elem_types)
+        t0 = type(v[0])
+        if t0 in numeric_scalar_types and all(type(elem) is t0 for elem in v):
+            # A list of numeric scalars of the same Python type is broadened
+            # to that type, so one element is enough
+            elem_type = self(v[0], **kwargs)
+        else:
+            elem_types = [self(elem, **kwargs) for elem in v]
+            elem_type = reduce(amerge, elem_types)
         return listof(_broaden(elem_type))
 
 
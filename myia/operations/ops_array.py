@@ -93,24 +93,32 @@ def t(arr, permutation=None):
 
 @dataclass(frozen=True)
 class SequenceIterator:
-    """Iterator to use for sequences like Array."""
+    """Iterator to use for sequences like Array.
+
+    The length of the sequence is computed once by `array_iter` and carried
+    along, so that `__myia_hasnext__` does not recompute it at every step.
+    """
 
     idx: int
     seq: object
+    length: object
 
     @core(ignore_values=True)
     def __myia_hasnext__(self):
         """Whether the index is past the length of the sequence."""
-        return self.idx < len(self.seq)
+        return self.idx < self.length
 
     @core(ignore_values=True)
     def __myia_next__(self):
         """Return the next element and a new iterator."""
-        return self.seq[self.idx], SequenceIterator(self.idx + 1, self.seq)
+        return (
+            self.seq[self.idx],
+            SequenceIterator(self.idx + 1, self.seq, self.length),
+        )
 
 
 @to_opdef
 @core
 def array_iter(xs):
     """Iterator for Array."""
-    return SequenceIterator(0, xs)
+    return SequenceIterator(0, xs, len(xs))
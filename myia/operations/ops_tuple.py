@@ -18,13 +18,6 @@ from ..operations import hastype, primitives as P, tuple_getitem
 from .utils import to_opdef
 
 
-@to_opdef
-@core
-def tuple_next(xs):
-    """Next tuple."""
-    return xs[0], xs[1:]
-
-
 @to_opdef
 @core
 def tuple_hasnext(xs):
@@ -79,6 +72,20 @@ def tuple_concat(self, g, args):
     return g.apply(P.make_tuple, *reduce(operator.add, tups))
 
 
+@to_opdef
+@tuple_reorganizer
+def tuple_next(self, g, args):
+    """Metagraph for the first element of a tuple and the rest of it.
+
+    This builds the rest directly instead of going through a slice.
+    """
+    (tuparg,) = check_nargs("tuple_next", 1, args)
+    (tup,) = self.map_tuples(g, g.parameters, [tuparg])
+    if not tup:
+        raise MyiaTypeError("Cannot get the next element of an empty tuple")
+    return g.apply(P.make_tuple, tup[0], g.apply(P.make_tuple, *tup[1:]))
+
+
 @to_opdef
 @tuple_reorganizer
 def tuple_getslice(self, g, args):
@@ -18,15 +18,83 @@ from ..lib import (
     standard_prim,
 )
 from . import primitives as P
+from .utils import Primitive, get_ufunc
 
 
 def pyimpl_array_map(fn, *arrays):
     """Implement `array_map`."""
+    ufunc = get_ufunc(fn)
+    if ufunc is not None:
+        # Force result to be ndarray, even if it's 0d
+        return np.asarray(ufunc(*arrays))
     return np.vectorize(fn)(*arrays)
 
 
+def _ufunc_graph(g, nargs):
+    """Return the applications in g, in order, if they all map to ufuncs.
+
+    This returns None unless g only applies primitives that have a NumPy
+    ufunc, to its own parameters and to scalar constants, and its output
+    depends on at least one parameter. Such a graph can be evaluated once on
+    whole arrays instead of once per element.
+    """
+    if len(g.parameters) != nargs:
+        return None
+
+    order = []
+    seen = set()
+
+    def visit(node):
+        if node in seen:
+            return True
+        seen.add(node)
+        if node.is_parameter():
+            return node.graph is g
+        elif node.is_constant():
+            return isinstance(node.value, (bool, int, float, np.number))
+        elif (
+            node.is_apply()
+            and node.graph is g
+            and node.inputs[0].is_constant(Primitive)
+            and get_ufunc(node.inputs[0].value) is not None
+            and all(visit(inp) for inp in node.inputs[1:])
+        ):
+            order.append(node)
+            return True
+        else:
+            return False
+
+    if not g.output.is_apply() or not visit(g.output):
+        return None
+    if not any(p in seen for p in g.parameters):
+        # The result would not have the shape of the arrays
+        return None
+    return order
+
+
 def debugvm_array_map(vm, fn, *arrays):
     """Implement `array_map` for the debug VM."""
+    if get_ufunc(fn) is not None:
+        return pyimpl_array_map(fn, *arrays)
+
+    if isinstance(fn, Graph):
+        key = (fn, len(arrays))
+        if key not in vm._ufunc_graphs:
+            vm._ufunc_graphs[key] = _ufunc_graph(fn, len(arrays))
+        order = vm._ufunc_graphs[key]
+    else:
+        order = None
+    if order is not None:
+        values = dict(zip(fn.parameters, arrays))
+        for node in order:
+            ufunc = get_ufunc(node.inputs[0].value)
+            args = [
+                values[inp] if inp in values else inp.value
+                for inp in node.inputs[1:]
+            ]
+            values[node] = ufunc(*args)
+        # Force result to be ndarray, even if it's 0d
+        return np.asarray(values[fn.output])
 
     def fn_(*args):
         return vm.call(fn, args)
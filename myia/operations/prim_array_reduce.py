@@ -19,12 +19,13 @@ from ..lib import (
 )
 from ..operations import distribute, shape, zeros_like
 from . import primitives as P
+from .utils import get_ufunc
 
 
 def pyimpl_array_reduce(fn, array, shp):
     """Implement `array_reduce`."""
     idtype = array.dtype
-    ufn = np.frompyfunc(fn, 2, 1)
+    ufn = get_ufunc(fn) or np.frompyfunc(fn, 2, 1)
     delta = len(array.shape) - len(shp)
     if delta < 0:
         raise ValueError("Shape to reduce to cannot be larger than original")
@@ -59,9 +60,11 @@ def pyimpl_array_reduce(fn, array, shp):
 
 def debugvm_array_reduce(vm, fn, array, shp):
     """Implement `array_reduce` for the debug VM."""
+    if get_ufunc(fn) is not None:
+        return pyimpl_array_reduce(fn, array, shp)
 
     def fn_(a, b):
-        return vm.call(fn, [a, b])
+        return vm.call(fn, (a, b))
 
     return pyimpl_array_reduce(fn_, array, shp)
 
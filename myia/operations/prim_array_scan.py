@@ -3,28 +3,41 @@
 import numpy as np
 
 from . import primitives as P
+from .utils import get_ufunc
 
 
 def pyimpl_array_scan(fn, init, array, axis):
     """Implement `array_scan`."""
     # This is inclusive scan because it's easier to implement
     # We will have to discuss what semantics we want later
-    def f(ary):
-        val = init
-        it = np.nditer([ary, None])
-        for x, y in it:
-            val = fn(val, x)
-            y[...] = val
-        return it.operands[1]
-
-    return np.apply_along_axis(f, axis, array)
+    ufn = get_ufunc(fn)
+    if ufn is not None and ufn.identity is not None and init == ufn.identity:
+        # fn(init, x) == x, so there is no need to copy the array to
+        # prepend init
+        return ufn.accumulate(array, axis=axis, dtype=array.dtype)
+    elif ufn is None:
+        ufn = np.frompyfunc(fn, 2, 1)
+        dtype = object
+    else:
+        dtype = array.dtype
+    # Prepend init along the axis so that the first step is fn(init, x0),
+    # then drop it from the result
+    init_shape = list(array.shape)
+    init_shape[axis] = 1
+    start = np.full(init_shape, init, dtype=dtype)
+    res = ufn.accumulate(np.concatenate((start, array), axis=axis), axis=axis)
+    idx = [slice(None)] * res.ndim
+    idx[axis] = slice(1, None)
+    return res[tuple(idx)].astype(array.dtype, copy=False)
 
 
 def debugvm_array_scan(vm, fn, init, array, axis):
     """Implement `array_scan` for the debug VM."""
+    if get_ufunc(fn) is not None:
+        return pyimpl_array_scan(fn, init, array, axis)
 
     def fn_(a, b):
-        return vm.call(fn, [a, b])
+        return vm.call(fn, (a, b))
 
     return pyimpl_array_scan(fn_, init, array, axis)
 
@@ -1,7 +1,5 @@
 """Definitions for the primitive `array_setitem`."""
 
-from copy import copy
-
 from .. import lib
 from ..lib import standard_prim
 from . import primitives as P
@@ -10,7 +8,7 @@ from . import primitives as P
 def pyimpl_array_setitem(data, begin, end, strides, value):
     """Implement `list/array_setitem`."""
     idx = tuple(slice(b, e, s) for b, e, s in zip(begin, end, strides))
-    data2 = copy(data)
+    data2 = data.copy()
     data2[idx] = value
     return data2
 
@@ -1,5 +1,7 @@
 """Definitions for the primitive `partial`."""
 
+import functools
+
 from ..lib import (
     AbstractFunction,
     PartialApplication,
@@ -11,11 +13,7 @@ from . import primitives as P
 
 def pyimpl_partial(f, *args):
     """Implement `partial`."""
-
-    def res(*others):
-        return f(*(args + others))
-
-    return res
+    return functools.partial(f, *args)
 
 
 @standard_prim(P.partial)
@@ -1,5 +1,7 @@
 """Definitions for the primitive `scalar_abs`."""
 
+import numpy as np
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -12,7 +14,8 @@ from . import primitives as P
 
 def pyimpl_scalar_abs(x: Number) -> Number:
     """Implement `scalar_abs`."""
-    assert_scalar(x)
+    if __debug__:
+        assert_scalar(x)
     return abs(x)
 
 
@@ -40,6 +43,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_abs",
     "type": "backend",
     "python_implementation": pyimpl_scalar_abs,
+    "operator_impl": abs,
+    "numpy_ufunc": np.absolute,
     "inferrer_constructor": infer_scalar_abs,
     "grad_transform": bprop_scalar_abs,
 }
@@ -1,5 +1,9 @@
 """Definitions for the primitive `scalar_add`."""
 
+import operator
+
+import numpy as np
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -11,7 +15,8 @@ from . import primitives as P
 
 def pyimpl_scalar_add(x: Number, y: Number) -> Number:
     """Implement `scalar_add`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x + y
 
 
@@ -39,6 +44,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_add",
     "type": "backend",
     "python_implementation": pyimpl_scalar_add,
+    "operator_impl": operator.add,
+    "numpy_ufunc": np.add,
     "inferrer_constructor": infer_scalar_add,
     "grad_transform": bprop_scalar_add,
 }
@@ -1,5 +1,9 @@
 """Definitions for the primitive `scalar_bit_and` x & y."""
 
+import operator
+
+import numpy as np
+
 from ..lib import UniformPrimitiveInferrer, assert_scalar
 from ..xtype import Integral
 from . import primitives as P
@@ -7,7 +11,8 @@ from . import primitives as P
 
 def pyimpl_scalar_bit_and(x: Integral, y: Integral) -> Integral:
     """Implement `scalar_bit_and`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x & y
 
 
@@ -27,6 +32,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_bit_and",
     "type": "backend",
     "python_implementation": pyimpl_scalar_bit_and,
+    "operator_impl": operator.and_,
+    "numpy_ufunc": np.bitwise_and,
     "inferrer_constructor": infer_scalar_bit_and,
     "grad_transform": None,
 }
@@ -1,5 +1,9 @@
 """Definitions for the primitive `scalar_bit_not` ~x."""
 
+import operator
+
+import numpy as np
+
 from ..lib import UniformPrimitiveInferrer, assert_scalar
 from ..xtype import Integral
 from . import primitives as P
@@ -7,7 +11,8 @@ from . import primitives as P
 
 def pyimpl_scalar_bit_not(x: Integral) -> Integral:
     """Implement `scalar_bit_not`."""
-    assert_scalar(x)
+    if __debug__:
+        assert_scalar(x)
     return ~x
 
 
@@ -27,6 +32,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_bit_not",
     "type": "backend",
     "python_implementation": pyimpl_scalar_bit_not,
+    "operator_impl": operator.invert,
+    "numpy_ufunc": np.invert,
     "inferrer_constructor": infer_scalar_bit_not,
     "grad_transform": None,
 }
@@ -1,5 +1,9 @@
 """Definitions for the primitive `scalar_bit_or` x | y."""
 
+import operator
+
+import numpy as np
+
 from ..lib import UniformPrimitiveInferrer, assert_scalar
 from ..xtype import Integral
 from . import primitives as P
@@ -7,7 +11,8 @@ from . import primitives as P
 
 def pyimpl_scalar_bit_or(x: Integral, y: Integral) -> Integral:
     """Implement `scalar_bit_or`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x | y
 
 
@@ -27,6 +32,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_bit_or",
     "type": "backend",
     "python_implementation": pyimpl_scalar_bit_or,
+    "operator_impl": operator.or_,
+    "numpy_ufunc": np.bitwise_or,
     "inferrer_constructor": infer_scalar_bit_or,
     "grad_transform": None,
 }
@@ -1,5 +1,7 @@
 """Definitions for the primitive `scalar_bit_rshift` x >> y."""
 
+import operator
+
 from ..lib import UniformPrimitiveInferrer, assert_scalar
 from ..xtype import Integral
 from . import primitives as P
@@ -7,7 +9,8 @@ from . import primitives as P
 
 def pyimpl_scalar_bit_rshift(x: Integral, y: Integral) -> Integral:
     """Implement `scalar_bit_rshift`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x >> y
 
 
@@ -27,6 +30,7 @@ __primitive_defaults__ = {
     "registered_name": "scalar_bit_rshift",
     "type": "backend",
     "python_implementation": pyimpl_scalar_bit_rshift,
+    "operator_impl": operator.rshift,
     "inferrer_constructor": infer_scalar_bit_rshift,
     "grad_transform": None,
 }
@@ -9,7 +9,8 @@ from . import primitives as P
 
 def pyimpl_scalar_cos(x: Number) -> Number:
     """Implement `scalar_cos`."""
-    assert_scalar(x)
+    if __debug__:
+        assert_scalar(x)
     return math.cos(x)
 
 
@@ -31,6 +32,7 @@ __primitive_defaults__ = {
     "registered_name": "scalar_cos",
     "type": "backend",
     "python_implementation": pyimpl_scalar_cos,
+    "operator_impl": math.cos,
     "inferrer_constructor": infer_scalar_cos,
     "grad_transform": None,
 }
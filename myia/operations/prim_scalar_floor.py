@@ -9,7 +9,8 @@ from . import primitives as P
 
 def pyimpl_scalar_floor(x: Number) -> Number:
     """Implement `scalar_floor`."""
-    assert_scalar(x)
+    if __debug__:
+        assert_scalar(x)
     return math.floor(x)
 
 
@@ -31,6 +32,7 @@ __primitive_defaults__ = {
     "registered_name": "scalar_floor",
     "type": "backend",
     "python_implementation": pyimpl_scalar_floor,
+    "operator_impl": math.floor,
     "inferrer_constructor": infer_scalar_floor,
     "grad_transform": None,
 }
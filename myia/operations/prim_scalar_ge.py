@@ -1,5 +1,9 @@
 """Definitions for the primitive `scalar_ge`."""
 
+import operator
+
+import numpy as np
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -12,7 +16,8 @@ from . import primitives as P
 
 def pyimpl_scalar_ge(x: Number, y: Number) -> Bool:
     """Implement `scalar_ge`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x >= y
 
 
@@ -40,6 +45,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_ge",
     "type": "backend",
     "python_implementation": pyimpl_scalar_ge,
+    "operator_impl": operator.ge,
+    "numpy_ufunc": np.greater_equal,
     "inferrer_constructor": infer_scalar_ge,
     "grad_transform": bprop_scalar_ge,
 }
@@ -1,5 +1,9 @@
 """Definitions for the primitive `scalar_le`."""
 
+import operator
+
+import numpy as np
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -12,7 +16,8 @@ from . import primitives as P
 
 def pyimpl_scalar_le(x: Number, y: Number) -> Bool:
     """Implement `scalar_le`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x <= y
 
 
@@ -40,6 +45,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_le",
     "type": "backend",
     "python_implementation": pyimpl_scalar_le,
+    "operator_impl": operator.le,
+    "numpy_ufunc": np.less_equal,
     "inferrer_constructor": infer_scalar_le,
     "grad_transform": bprop_scalar_le,
 }
@@ -1,5 +1,7 @@
 """Definitions for the primitive `scalar_mod`."""
 
+import operator
+
 from ..lib import UniformPrimitiveInferrer, assert_scalar
 from ..xtype import Number
 from . import primitives as P
@@ -7,7 +9,8 @@ from . import primitives as P
 
 def pyimpl_scalar_mod(x: Number, y: Number) -> Number:
     """Implement `scalar_mod`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x % y
 
 
@@ -29,6 +32,7 @@ __primitive_defaults__ = {
     "registered_name": "scalar_mod",
     "type": "backend",
     "python_implementation": pyimpl_scalar_mod,
+    "operator_impl": operator.mod,
     "inferrer_constructor": infer_scalar_mod,
     "grad_transform": None,
 }
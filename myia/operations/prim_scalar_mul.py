@@ -1,5 +1,9 @@
 """Definitions for the primitive `scalar_mul`."""
 
+import operator
+
+import numpy as np
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -11,7 +15,8 @@ from . import primitives as P
 
 def pyimpl_scalar_mul(x: Number, y: Number) -> Number:
     """Implement `scalar_mul`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x * y
 
 
@@ -39,6 +44,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_mul",
     "type": "backend",
     "python_implementation": pyimpl_scalar_mul,
+    "operator_impl": operator.mul,
+    "numpy_ufunc": np.multiply,
     "inferrer_constructor": infer_scalar_mul,
     "grad_transform": bprop_scalar_mul,
 }
@@ -1,5 +1,9 @@
 """Definitions for the primitive `scalar_ne`."""
 
+import operator
+
+import numpy as np
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -12,7 +16,8 @@ from . import primitives as P
 
 def pyimpl_scalar_ne(x: Number, y: Number) -> Bool:
     """Implement `scalar_ne`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x != y
 
 
@@ -40,6 +45,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_ne",
     "type": "backend",
     "python_implementation": pyimpl_scalar_ne,
+    "operator_impl": operator.ne,
+    "numpy_ufunc": np.not_equal,
     "inferrer_constructor": infer_scalar_ne,
     "grad_transform": bprop_scalar_ne,
 }
@@ -1,5 +1,7 @@
 """Definitions for the primitive `scalar_pow`."""
 
+import operator
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -11,7 +13,8 @@ from . import primitives as P
 
 def pyimpl_scalar_pow(x: Number, y: Number) -> Number:
     """Implement `scalar_pow`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x ** y
 
 
@@ -43,6 +46,7 @@ __primitive_defaults__ = {
     "registered_name": "scalar_pow",
     "type": "backend",
     "python_implementation": pyimpl_scalar_pow,
+    "operator_impl": operator.pow,
     "inferrer_constructor": infer_scalar_pow,
     "grad_transform": bprop_scalar_pow,
 }
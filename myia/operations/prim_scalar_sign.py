@@ -14,7 +14,8 @@ from . import primitives as P
 
 def pyimpl_scalar_sign(x: Number) -> Number:
     """Implement `scalar_sign`."""
-    assert_scalar(x)
+    if __debug__:
+        assert_scalar(x)
     return np.sign(x)
 
 
@@ -42,6 +43,7 @@ __primitive_defaults__ = {
     "registered_name": "scalar_sign",
     "type": "backend",
     "python_implementation": pyimpl_scalar_sign,
+    "numpy_ufunc": np.sign,
     "inferrer_constructor": infer_scalar_sign,
     "grad_transform": bprop_scalar_sign,
 }
@@ -1,5 +1,9 @@
 """Definitions for the primitive `scalar_sub`."""
 
+import operator
+
+import numpy as np
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -11,7 +15,8 @@ from . import primitives as P
 
 def pyimpl_scalar_sub(x: Number, y: Number) -> Number:
     """Implement `scalar_sub`."""
-    assert_scalar(x, y)
+    if __debug__:
+        assert_scalar(x, y)
     return x - y
 
 
@@ -39,6 +44,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_sub",
     "type": "backend",
     "python_implementation": pyimpl_scalar_sub,
+    "operator_impl": operator.sub,
+    "numpy_ufunc": np.subtract,
     "inferrer_constructor": infer_scalar_sub,
     "grad_transform": bprop_scalar_sub,
 }
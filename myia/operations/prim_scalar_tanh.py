@@ -2,6 +2,8 @@
 
 import math
 
+import numpy as np
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -13,7 +15,8 @@ from . import primitives as P
 
 def pyimpl_scalar_tanh(x: Number) -> Number:
     """Implement `scalar_tanh`."""
-    assert_scalar(x)
+    if __debug__:
+        assert_scalar(x)
     return math.tanh(x)
 
 
@@ -41,6 +44,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_tanh",
     "type": "backend",
     "python_implementation": pyimpl_scalar_tanh,
+    "operator_impl": math.tanh,
+    "numpy_ufunc": np.tanh,
     "inferrer_constructor": infer_scalar_tanh,
     "grad_transform": bprop_scalar_tanh,
 }
@@ -9,7 +9,8 @@ from . import primitives as P
 
 def pyimpl_scalar_trunc(x: Number) -> Number:
     """Implement `scalar_trunc`."""
-    assert_scalar(x)
+    if __debug__:
+        assert_scalar(x)
     return math.trunc(x)
 
 
@@ -31,6 +32,7 @@ __primitive_defaults__ = {
     "registered_name": "scalar_trunc",
     "type": "backend",
     "python_implementation": pyimpl_scalar_trunc,
+    "operator_impl": math.trunc,
     "inferrer_constructor": infer_scalar_trunc,
     "grad_transform": None,
 }
@@ -1,5 +1,7 @@
 """Definitions for the primitive `scalar_uadd`."""
 
+import numpy as np
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -11,7 +13,8 @@ from . import primitives as P
 
 def pyimpl_scalar_uadd(x: Number) -> Number:
     """Implement `scalar_uadd`."""
-    assert_scalar(x)
+    if __debug__:
+        assert_scalar(x)
     return x
 
 
@@ -39,6 +42,7 @@ __primitive_defaults__ = {
     "registered_name": "scalar_uadd",
     "type": "backend",
     "python_implementation": pyimpl_scalar_uadd,
+    "numpy_ufunc": np.positive,
     "inferrer_constructor": infer_scalar_uadd,
     "grad_transform": bprop_scalar_uadd,
 }
@@ -1,5 +1,9 @@
 """Definitions for the primitive `scalar_usub`."""
 
+import operator
+
+import numpy as np
+
 from ..lib import (
     UniformPrimitiveInferrer,
     assert_scalar,
@@ -11,7 +15,8 @@ from . import primitives as P
 
 def pyimpl_scalar_usub(x: Number) -> Number:
     """Implement `scalar_usub`."""
-    assert_scalar(x)
+    if __debug__:
+        assert_scalar(x)
     return -x
 
 
@@ -39,6 +44,8 @@ __primitive_defaults__ = {
     "registered_name": "scalar_usub",
     "type": "backend",
     "python_implementation": pyimpl_scalar_usub,
+    "operator_impl": operator.neg,
+    "numpy_ufunc": np.negative,
     "inferrer_constructor": infer_scalar_usub,
     "grad_transform": bprop_scalar_usub,
 }
@@ -7,7 +7,7 @@ from . import primitives as P
 
 def pyimpl_tuple_setitem(data, item, value):
     """Implement `tuple_setitem`."""
-    return tuple(value if i == item else x for i, x in enumerate(data))
+    return data[:item] + (value,) + data[item + 1 :]
 
 
 @standard_prim(P.tuple_setitem)
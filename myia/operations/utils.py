@@ -87,3 +87,16 @@ def to_opdef(fn):
     return OperationDefinition(
         name=name, registered_name=name, mapping=fn, python_implementation=None
     )
+
+
+def get_ufunc(fn):
+    """Return the NumPy ufunc equivalent to fn, or None.
+
+    fn may be a Primitive, or an Operation that maps to a Primitive. Only
+    primitives that declare a `numpy_ufunc` in their defaults have one.
+    """
+    if isinstance(fn, Operation):
+        fn = fn.defaults().get("mapping", None)
+    if isinstance(fn, Primitive):
+        return fn.defaults().get("numpy_ufunc", None)
+    return None
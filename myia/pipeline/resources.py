@@ -12,7 +12,13 @@ from ..ir import Graph, clone
 from ..monomorphize import Monomorphizer
 from ..operations.utils import Operation
 from ..opt import LocalPassOptimizer, lib as optlib
-from ..utils import MyiaConversionError, Partial, Partializable, tracer
+from ..utils import (
+    MyiaConversionError,
+    Partial,
+    Partializable,
+    numeric_scalar_types,
+    tracer,
+)
 from ..vm import VM
 from .pipeline import Pipeline
 
@@ -57,7 +63,7 @@ def default_convert(env, g: Graph, manage):
 
 @ovld  # noqa: F811
 def default_convert(env, seq: (tuple, list), manage):
-    return type(seq)(env(x, manage) for x in seq)
+    return type(seq)([env(x, manage) for x in seq])
 
 
 @ovld  # noqa: F811
@@ -93,6 +99,11 @@ def default_convert(env, x: np.dtype, manage):
     return env(xtype.np_dtype_to_type(x.name), manage)
 
 
+# Immutable scalars convert to themselves, so the converter returns them
+# without going through the cache and default_convert.
+_scalar_types = numeric_scalar_types | {str, type(None), np.bool_}
+
+
 class ConverterResource(Partializable):
     """Convert a Python object into an object that can be in a Myia graph."""
 
@@ -113,6 +124,8 @@ class ConverterResource(Partializable):
 
     def __call__(self, value, manage=True):
         """Convert a value."""
+        if type(value) in _scalar_types:
+            return value
         try:
             v = self.get_cached(value)
         except (TypeError, KeyError):
@@ -28,7 +28,15 @@ from .resources import (
     Tracker,
 )
 
-py_registry = Registry(default_field="python_implementation")
+# The Python implementations of some scalar primitives only wrap a builtin
+# after their assert_scalar check, which python -O removes. Those primitives
+# declare the builtin as their operator_impl, which we call directly in that
+# case to save a Python frame per call.
+py_registry = Registry(
+    default_field="python_implementation"
+    if __debug__
+    else ("operator_impl", "python_implementation")
+)
 vm_registry = Registry(default_field="debugvm_implementation")
 grad_registry = Registry(default_field="grad_transform")
 inferrer_registry = Registry(default_field="inferrer_constructor")
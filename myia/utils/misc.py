@@ -69,7 +69,11 @@ MISSING = Named("MISSING")
 
 
 class Registry(Dict[T1, T2]):
-    """Associates primitives to implementations."""
+    """Associates primitives to implementations.
+
+    default_field may be a tuple of fields, in which case the first one
+    that is present in a primitive's defaults is used.
+    """
 
     def __init__(self, default_field=None) -> None:
         """Initialize a Registry."""
@@ -90,6 +94,12 @@ class Registry(Dict[T1, T2]):
     def __missing__(self, prim):
         if self.default_field and isinstance(prim, HasDefaults):
             dflt = prim.defaults()
+            if isinstance(self.default_field, tuple):
+                *fields, last = self.default_field
+                for field in fields:
+                    if field in dflt:
+                        return dflt[field]
+                return dflt[last]
             return dflt[self.default_field]
         raise KeyError(prim)
 
@@ -436,13 +446,37 @@ def resolve_from_path(path):
     return getattr(mod, field)
 
 
+# Python and NumPy types of the numeric scalars Myia handles
+numeric_scalar_types = frozenset(
+    {
+        bool,
+        int,
+        float,
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.float16,
+        np.float32,
+        np.float64,
+    }
+)
+
+
 def assert_scalar(*args):
     """Assert that the arguments are all scalars."""
     # TODO: These checks should be stricter, e.g. require that all args
     # have exactly the same type, but right now there is some mixing between
     # numpy types and int/float.
     for x in args:
-        if isinstance(x, np.ndarray):
+        if type(x) in numeric_scalar_types:
+            # Fast path for the most common types
+            continue
+        elif isinstance(x, np.ndarray):
             if x.shape != ():
                 msg = f"Expected scalar, not array with shape {x.shape}"
                 raise TypeError(msg)
@@ -582,6 +616,7 @@ __all__ = [
     "is_dataclass_type",
     "keyword_decorator",
     "list_str",
+    "numeric_scalar_types",
     "repr_",
     "resolve_from_path",
     "tags",
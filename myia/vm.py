@@ -5,6 +5,8 @@ testing or debugging.  Don't expect stellar performance from this
 implementation.
 """
 
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+from types import FunctionType
 from typing import Any, Iterable, List, Mapping
 
 from .abstract import AbstractClassBase
@@ -15,6 +17,46 @@ from .operations.primitives import partial, return_
 from .utils import TypeMap, untested
 
 
+def _wrap1(fn):
+    return lambda _, a: fn(a)
+
+
+def _wrap2(fn):
+    return lambda _, a, b: fn(a, b)
+
+
+def _wrap3(fn):
+    return lambda _, a, b, c: fn(a, b, c)
+
+
+def _wrap4(fn):
+    return lambda _, a, b, c, d: fn(a, b, c, d)
+
+
+def _wrapn(fn):
+    return lambda _, *args: fn(*args)
+
+
+_wrappers = {1: _wrap1, 2: _wrap2, 3: _wrap3, 4: _wrap4}
+
+
+def _wrap_pyimpl(fn):
+    """Adapt a Python implementation to the VM calling convention.
+
+    Plain functions with a fixed number of positional arguments get a
+    wrapper of the same arity, which avoids packing and unpacking `*args` on
+    each call. Other callables, e.g. bound methods, whose code counts `self`
+    as an argument, get the generic wrapper.
+    """
+    if (
+        not isinstance(fn, FunctionType)
+        or fn.__defaults__
+        or fn.__code__.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+    ):
+        return _wrapn(fn)
+    return _wrappers.get(fn.__code__.co_argcount, _wrapn)(fn)
+
+
 class VMFrame:
     """An execution frame.
 
@@ -116,7 +158,15 @@ class VM:
         )
         self.implementations = implementations
         self.py_implementations = py_implementations
+        # Primitives that need access to the VM's state are handled through
+        # the same table as the others, so dispatch is a single lookup.
+        self._vmimpls = {
+            return_: self._vmimpl_return,
+            partial: self._vmimpl_partial,
+        }
         self._vars = dict()
+        self._schedules = dict()
+        self._ufunc_graphs = dict()
 
     def _compute_fvs(self, graph):
         rval = set()
@@ -135,7 +185,7 @@ class VM:
             self._vars[g] = self._compute_fvs(g)
 
     def _export_sequence(self, seq):
-        return type(seq)(self.export(x) for x in seq)
+        return type(seq)([self.export(x) for x in seq])
 
     def _export_Primitive(self, prim):
         return self.py_implementations[prim]
@@ -177,7 +227,7 @@ class VM:
             raise RuntimeError("Call with wrong number of arguments")
 
         top_frame = VMFrame(
-            toposort(graph.return_, self._succ_vm(graph)),
+            self._schedule(graph),
             dict(zip(graph.parameters, args)),
             closure=closure,
         )
@@ -204,6 +254,19 @@ class VM:
                 else:
                     return self.export(r.value)
 
+    def _schedule(self, graph):
+        """Return the order in which to evaluate the nodes of a graph.
+
+        The order only depends on the graph, so it is computed once and
+        reused by every frame that executes that graph.
+        """
+        try:
+            return self._schedules[graph]
+        except KeyError:
+            nodes = list(toposort(graph.return_, self._succ_vm(graph)))
+            self._schedules[graph] = nodes
+            return nodes
+
     def _succ_vm(self, graph):
         """Return a visitor for the graph."""
 
@@ -223,12 +286,24 @@ class VM:
 
         return succ
 
+    @staticmethod
+    def _vmimpl_return(vm, value):
+        raise vm._Return(value)
+
+    @staticmethod
+    def _vmimpl_partial(vm, fn, *args):
+        return Partial(fn, args, vm)
+
     def _vmimpl(self, prim):
         try:
-            return self.implementations[prim]
+            return self._vmimpls[prim]
         except KeyError:
-            fn = self.py_implementations[prim]
-            return lambda _, *args: fn(*args)
+            try:
+                impl = self.implementations[prim]
+            except KeyError:
+                impl = _wrap_pyimpl(self.py_implementations[prim])
+            self._vmimpls[prim] = impl
+            return impl
 
     def call(self, fn, args):
         """Call the `fn` object.
@@ -263,7 +338,7 @@ class VM:
 
         raise self._Call(
             VMFrame(
-                toposort(graph.return_, self._succ_vm(graph)),
+                self._schedule(graph),
                 dict(zip(graph.parameters, args)),
                 closure=clos,
             )
@@ -277,14 +352,7 @@ class VM:
 
     def _dispatch_call(self, node, frame, fn, args):
         if isinstance(fn, Primitive):
-            if fn == return_:
-                raise self._Return(args[0])
-            elif fn == partial:
-                partial_fn, *partial_args = args
-                res = Partial(partial_fn, partial_args, self)
-                frame.values[node] = res
-            else:
-                frame.values[node] = self._vmimpl(fn)(self, *args)
+            frame.values[node] = self._vmimpl(fn)(self, *args)
         elif isinstance(fn, Partial):
             self._dispatch_call(node, frame, fn.fn, fn.args + tuple(args))
         elif isinstance(fn, (Graph, Closure)):
@@ -7,6 +7,8 @@ import sys
 from collections import Counter
 from types import ModuleType
 
+import numpy as np
+
 from myia.abstract import to_abstract
 from myia.compile.backends import Backend, Converter
 from myia.compile.transform import convert_grad, get_prim_graph
@@ -15,13 +17,70 @@ from myia.graph_utils import toposort
 from myia.ir import Graph, manage
 from myia.lib import ANYTHING, AbstractArray, AbstractTuple
 from myia.operations import Primitive, primitives as P
+from myia.operations.utils import get_ufunc
 from myia.xtype import type_to_np_dtype
 
 
+def _is_fusable_map(c, node):
+    """Check whether an array_map can write its result in node's buffer.
+
+    This is the case when node is the result of another array_map on a
+    ufunc, computed in the same function, and the only use of that result
+    is the array_map being compiled, which has the same type and whose
+    ufunc produces the dtype of node's buffer.
+    """
+    if not (
+        node.is_apply(P.array_map)
+        and node.graph is c.graph
+        and get_ufunc(node.inputs[1].value) is not None
+    ):
+        return False
+    uses = node.graph.manager.uses[node]
+    if len(uses) != 1:
+        return False
+    ((user, _),) = uses
+    if node.abstract is None or user.abstract != node.abstract:
+        return False
+    # E.g. np.tanh on an int array returns floats, whatever the abstract type
+    return _ufunc_dtype(user) == _array_dtype(node)
+
+
+def _array_dtype(node):
+    """Return the NumPy dtype of an array node, or None if unknown."""
+    a = node.abstract
+    if not isinstance(a, AbstractArray) or a.element is ANYTHING:
+        return None
+    t = a.element.xtype()
+    if t is ANYTHING:
+        return None
+    return np.dtype(type_to_np_dtype(t))
+
+
+def _ufunc_dtype(node):
+    """Return the dtype NumPy computes for an array_map on a ufunc."""
+    dtypes = [_array_dtype(a) for a in node.inputs[2:]]
+    if any(dtype is None for dtype in dtypes):
+        return None
+    ufunc = get_ufunc(node.inputs[1].value)
+    try:
+        return ufunc(*[np.empty(0, dtype=dtype) for dtype in dtypes]).dtype
+    except TypeError:
+        return None
+
+
 def python_array_map(c, fn, *arrays):
     """Implementation for primitive array_map."""
     assert fn.is_constant(Primitive)
-    return f"np.vectorize({c.ref(fn)})({', '.join(c.ref(a) for a in arrays)})"
+    args = ", ".join(c.ref(a) for a in arrays)
+    ufunc = get_ufunc(fn.value)
+    if ufunc is None:
+        return f"np.vectorize({c.ref(fn)})({args})"
+    for a in arrays:
+        if _is_fusable_map(c, a):
+            # The intermediate array is dead after this call, reuse it
+            return f"np.{ufunc.__name__}({args}, out={c.ref(a)})"
+    # Force result to be ndarray, even if it's 0d
+    return f"np.asarray(np.{ufunc.__name__}({args}))"
 
 
 def python_scalar_to_array(c, x, t):
@@ -49,7 +108,9 @@ def python_scalar_cast(c, x, t):
 
 def python_tuple_setitem(c, data, item, value):
     """Implementation for primitive setitem."""
-    return f"tuple({c.ref(value)} if i == {c.ref(item)} else x for i, x in enumerate({c.ref(data)}))"
+    data = c.ref(data)
+    item = c.ref(item)
+    return f"{data}[:{item}] + ({c.ref(value)},) + {data}[{item} + 1 :]"
 
 
 def python_unsafe_static_cast(c, x, t):
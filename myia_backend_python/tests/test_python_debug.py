@@ -1,5 +1,7 @@
 import io
 
+import numpy as np
+
 from myia import myia
 
 
@@ -16,3 +18,31 @@ def test_debug():
     code = output.getvalue()
     assert "def main(" in code
     print(code)
+
+
+def test_debug_array_map_out():
+    output = io.StringIO()
+
+    @myia(backend="python", backend_options={"debug": output})
+    def f(a, b):
+        return (a * b + a) * b
+
+    a = np.ones((2, 3))
+    b = np.full((2, 3), 2.0)
+    np.testing.assert_allclose(f(a, b), (a * b + a) * b)
+    code = output.getvalue()
+    assert "np.vectorize" not in code
+    assert code.count("out=") == 2
+    # Inputs must not be overwritten
+    np.testing.assert_allclose(a, np.ones((2, 3)))
+
+    output = io.StringIO()
+
+    @myia(backend="python", backend_options={"debug": output})
+    def g(a, b):
+        return np.tanh(a + b)
+
+    a = np.array([0, 1])
+    b = np.array([0, 1])
+    np.testing.assert_allclose(g(a, b), np.tanh(a + b))
+    assert "out=" not in output.getvalue()
@@ -1,3 +1,4 @@
+import inspect
 import math
 from math import (
     cos as math_cos,
@@ -14,6 +15,7 @@ import pytest
 
 from myia.abstract import ANYTHING, type_to_abstract
 from myia.operations import (
+    Primitive,
     array_cast,
     array_getitem,
     array_map,
@@ -33,11 +35,13 @@ from myia.operations import (
     full,
     identity,
     partial as myia_partial,
+    primitives as P,
     random_initialize,
     random_uint32,
     reshape,
     return_,
     scalar_abs,
+    scalar_add,
     scalar_bit_and,
     scalar_bit_lshift,
     scalar_bit_not,
@@ -46,6 +50,7 @@ from myia.operations import (
     scalar_bit_xor,
     scalar_cast,
     scalar_max,
+    scalar_mul,
     scalar_sign,
     scalar_to_array,
     shape,
@@ -235,6 +240,33 @@ def test_prim_shape():
     assert shape(v) == (2, 3)
 
 
+def test_prim_operator_impl():
+    # Under python -O, operator_impl replaces python_implementation
+    samples = [(7, 3), (-7, 2), (2.5, 1.5), (-0.5, 3.0)]
+
+    def outcome(fn, args):
+        try:
+            return fn(*args)
+        except Exception as e:
+            return type(e)
+
+    checked = 0
+    for name, prim in vars(P).items():
+        if not name.startswith("scalar_") or not isinstance(prim, Primitive):
+            continue
+        dflt = prim.defaults()
+        if "operator_impl" not in dflt:
+            continue
+        pyimpl = dflt["python_implementation"]
+        nargs = len(inspect.signature(pyimpl).parameters)
+        for sample in samples:
+            args = sample[:nargs]
+            expected = outcome(pyimpl, args)
+            assert outcome(dflt["operator_impl"], args) == expected, prim
+        checked += 1
+    assert checked > 0
+
+
 def test_prim_array_map():
     v = np.zeros((2, 3))
 
@@ -261,6 +293,31 @@ def test_prim_array_map2():
     assert (vres == 2).all()
 
 
+def test_prim_array_map_ufunc():
+    v1 = np.array([1, -2, 3], dtype="float32")
+    v2 = np.array([0, 5, -1], dtype="float32")
+
+    vres = array_map(scalar_add, v1, v2)
+    assert vres.dtype == np.float32
+    assert (vres == np.array([1, 3, 2])).all()
+
+    vres = array_map(scalar_abs, np.array(-2))
+    assert isinstance(vres, np.ndarray)
+    assert vres == 2
+
+
+def test_prim_array_map_nan():
+    # Builtin max and np.maximum do not agree on nan
+    v1 = np.array([1.0, np.nan])
+    v2 = np.array([np.nan, 1.0])
+    vres = array_map(scalar_max, v1, v2)
+    assert vres[0] == 1.0
+    assert np.isnan(vres[1])
+
+    vres = array_reduce(scalar_max, np.array([1.0, np.nan, 2.0]), (1,))
+    assert (vres == np.array([2.0])).all()
+
+
 def test_prim_array_scan():
     v = np.ones((2, 3))
 
@@ -274,6 +331,27 @@ def test_prim_array_scan():
     assert (v2 == vref).all()
 
 
+def test_prim_array_scan_ufunc():
+    v = np.array([[1, 3, 0], [4, -1, 5]])
+
+    v2 = array_scan(scalar_max, 2, v, 1)
+    assert v2.dtype == v.dtype
+    assert (v2 == np.array([[2, 3, 3], [4, 4, 5]])).all()
+
+    v2 = array_scan(scalar_max, 2, v, 0)
+    assert (v2 == np.array([[2, 3, 2], [4, 3, 5]])).all()
+
+    v2 = array_scan(scalar_add, 0, v, 1)
+    assert v2.dtype == v.dtype
+    assert (v2 == np.cumsum(v, axis=1)).all()
+
+    v2 = array_scan(scalar_mul, 1, v, 0)
+    assert (v2 == np.cumprod(v, axis=0)).all()
+
+    v2 = array_scan(scalar_mul, 2, v, 0)
+    assert (v2 == 2 * np.cumprod(v, axis=0)).all()
+
+
 def test_prim_array_reduce():
     def add(a, b):
         return a + b
@@ -285,6 +363,9 @@ def test_prim_array_reduce():
         (add, (2, 3, 7), (3, 1), 14),
         (add, (2, 3, 7), (1, 1, 1), 42),
         (add, (2, 3, 7), (), 42),
+        (scalar_max, (2, 3, 7), (1, 3, 1), 1),
+        (scalar_max, (2, 3, 7), (1, 3, 8), ValueError),
+        (scalar_max, (2, 3, 7), (), 1),
     ]
 
     for f, inshp, outshp, value in tests:
@@ -304,6 +385,8 @@ def test_prim_array_reduce():
 
 def test_prim_distribute():
     assert (distribute(1, (2, 3)) == np.ones((2, 3))).all()
+    v = np.ones((2, 3))
+    assert distribute(v, (2, 3)) is v
 
 
 def test_prim_reshape():
@@ -407,12 +490,15 @@ def test_assert_scalar():
     assert_scalar(0)
     assert_scalar(1.0, 2.0)
     assert_scalar(np.ones(()))
+    assert_scalar(True, np.float32(1.0), np.uint8(3))
     # with pytest.raises(TypeError):
     #     assert_scalar(1, 1.0)
     with pytest.raises(TypeError):
         assert_scalar(np.ones((2, 2)))
     with pytest.raises(TypeError):
         assert_scalar((1, 2), (3, 4))
+    with pytest.raises(TypeError):
+        assert_scalar(1, "x")
 
 
 def test_prim_identity():
@@ -77,6 +77,19 @@ def test_to_abstract_skey():
 def test_to_abstract_list():
     assert to_abstract([]) is empty
     assert to_abstract([1, 2, 3]) is listof(S(t=ty.Int[64]))
+    assert to_abstract([1.5, 2.5]) is listof(S(t=ty.Float[64]))
+    assert to_abstract([np.float32(1), np.float32(2)]) is listof(
+        S(t=ty.Float[32])
+    )
+    assert to_abstract([(1, 2), (3, 4)]) is listof(
+        T([S(t=ty.Int[64]), S(t=ty.Int[64])])
+    )
+    with pytest.raises(MyiaTypeError):
+        to_abstract([1, 2.5])
+    with pytest.raises(MyiaTypeError):
+        to_abstract([np.bool_(True), np.bool_(False)])
+    with pytest.raises(MyiaTypeError):
+        to_abstract(["a", "b"])
 
 
 def test_to_abstract_xtype():
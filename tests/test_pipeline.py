@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from myia.pipeline import Pipeline, Resources
+from myia.pipeline import Pipeline, Resources, standard_resources
 from myia.utils import Partializable
 
 
@@ -44,3 +45,22 @@ def test_Resources():
         r.unknown
 
     assert r2.sandal.model == "running"
+
+
+def test_convert_scalars():
+    convert = standard_resources().convert
+    scalars = [
+        True,
+        1,
+        2.5,
+        np.bool_(False),
+        np.int32(3),
+        np.uint8(4),
+        np.float32(1.5),
+        None,
+        "abc",
+    ]
+    for x in scalars:
+        assert convert(x) is x
+    for x in scalars:
+        assert (type(x), x) not in convert.object_map
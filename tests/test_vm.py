@@ -1,8 +1,18 @@
 import numpy as np
-
-from myia.operations import array_map, array_reduce, array_scan, scalar_usub
+import pytest
+
+from myia.operations import (
+    array_map,
+    array_reduce,
+    array_scan,
+    scalar_floor,
+    scalar_log,
+    scalar_sin,
+    scalar_usub,
+)
 from myia.pipeline import scalar_debug_compile as compile
 from myia.testing.multitest import mt, run_debug
+from myia.vm import _wrap_pyimpl
 
 
 @mt(run_debug(2, 3), run_debug(2.0, 3.0))
@@ -15,6 +25,23 @@ def test_vm_truediv(x, y):
     return x / y
 
 
+def test_wrap_pyimpl():
+    class Adder:
+        def __init__(self, n):
+            self.n = n
+
+        def add(self, x):
+            return x + self.n
+
+    def add2(x, y=2):
+        return x + y
+
+    assert _wrap_pyimpl(lambda x, y: x - y)(None, 5, 2) == 3
+    assert _wrap_pyimpl(Adder(3).add)(None, 1) == 4
+    assert _wrap_pyimpl(add2)(None, 1) == 3
+    assert _wrap_pyimpl(max)(None, 1, 2, 3) == 3
+
+
 def test_vm_array_map():
     @compile
     def f(x):
@@ -68,6 +95,72 @@ def test_vm_array_map_clos():
     assert (res == 4 * np.ones((2, 3))).all()
 
 
+def test_vm_array_map_composite():
+    @compile
+    def f(xs, ys):
+        def g(x, y):
+            return (x * y + x) * 2 - y
+
+        return array_map(g, xs, ys)
+
+    a = np.arange(6).reshape((2, 3))
+    b = np.full((2, 3), 3)
+    res = f(a, b)
+    assert res.dtype == a.dtype
+    assert (res == (a * b + a) * 2 - b).all()
+
+
+def test_vm_array_map_composite_fallback():
+    @compile
+    def f(xs):
+        def g(x):
+            return scalar_floor(x) + 1
+
+        return array_map(g, xs)
+
+    a = np.linspace(0, 3, 6).reshape((2, 3))
+    res = f(a)
+    assert (res == np.floor(a) + 1).all()
+
+
+def test_vm_array_map_constant():
+    @compile
+    def f(xs):
+        def g(x):
+            return scalar_usub(3)
+
+        return array_map(g, xs)
+
+    res = f(np.ones((2, 3)))
+    assert res.shape == (2, 3)
+    assert (res == -3).all()
+
+
+def test_vm_array_map_errors():
+    @compile
+    def f(xs, ys):
+        def g(x, y):
+            return x % y
+
+        return array_map(g, xs, ys)
+
+    @compile
+    def h(xs):
+        return array_map(scalar_log, xs)
+
+    with pytest.raises(ZeroDivisionError):
+        f(np.array([1, 2]), np.array([1, 0]))
+    with pytest.raises(ValueError):
+        h(np.array([1.0, -1.0]))
+
+    @compile
+    def k(xs):
+        return array_map(scalar_sin, xs)
+
+    with pytest.raises(ValueError):
+        k(np.array([0.0, np.inf]))
+
+
 def test_vm_array_scan():
     @compile
     def f(x):
@@ -225,6 +225,11 @@ def test_registry():
     with pytest.raises(KeyError):
         print(r["xyz"])
 
+    r2 = Registry(default_field=("apple", "banana"))
+    d = HasDefaults("d", {"apple": 1, "banana": 2}, defaults_field=None)
+    assert r2[d] == 1
+    assert r2[b] == 123
+
 
 def test_workset():
     ws = WorkSet([3, 5])